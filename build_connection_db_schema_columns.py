@@ -1,10 +1,12 @@
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import functools
+import itertools
 import logging
-import pandas as pd
-import boto3
-from botocore import UNSIGNED
-from botocore.client import Config
 from pyatlan.client.atlan import AtlanClient
 from pyatlan.cache.role_cache import RoleCache
+from pyatlan.errors import NotFoundError
 from pyatlan.model.assets import (
     Asset,
     Column,
@@ -19,64 +21,180 @@ from pyatlan.model.fluent_search import FluentSearch, CompoundQuery
 from io import StringIO
 # UPDATED: Added 're' module to support regex operations in listing S3 objects
 import re
+import shelve
+import sys
+import threading
 import config
 
-# Configure logging
-logging.basicConfig(
-    filename=config.LOG_FILE,
-    filemode='a',
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    level=getattr(logging, config.LOG_LEVEL.upper()),
+# Number of bytes and rows sampled from each CSV file to extract its columns and data types
+CSV_SAMPLE_BYTES = 64 * 1024
+# Largest sample fetched when a CSV file's header row is longer than CSV_SAMPLE_BYTES
+CSV_SAMPLE_MAX_BYTES = 16 * 1024 * 1024
+CSV_SAMPLE_ROWS = 1000
+
+# Number of threads prefetching CSV samples from S3
+S3_PREFETCH_WORKERS = 4
+
+# Plain integer and decimal literals; unlike int() and float(), these reject '1_000', 'nan' and 'inf',
+# which pandas kept as strings
+INT_PATTERN = re.compile(r'[+-]?\d+')
+FLOAT_PATTERN = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?')
+
+# Map inferred Python types to Atlan data types
+PYTHON_TO_ATLAN_TYPES = {
+    int: 'bigint',
+    float: 'double',
+    bool: 'boolean',
+    str: 'string',
+}
+
+# Number of CSV files processed concurrently
+MAX_WORKERS = getattr(config, 'MAX_WORKERS', 8)
+
+# UPDATED: Initialize the Atlan client on first use, so importing this module doesn't connect to Atlan
+@functools.lru_cache(maxsize=None)
+def get_client():
+    """Return the shared Atlan client, creating it on first use."""
+    return AtlanClient(
+        base_url=config.BASE_URL,
+        api_key=config.API_TOKEN,
+    )
+
+# UPDATED: Import boto3 and initialize the S3 client on first use, so importers that only need the Atlan
+# helpers don't pay for it
+@functools.lru_cache(maxsize=None)
+def get_s3_client():
+    """Return the shared S3 client for anonymous access, creating it on first use."""
+    import boto3
+    from botocore import UNSIGNED
+    from botocore.client import Config
+
+    # UPDATED: Create the client from a single Session, with a connection pool sized for the worker threads,
+    # TCP keep-alive and adaptive retries
+    s3_session = boto3.Session()
+    return s3_session.client(
+        's3',
+        config=Config(
+            signature_version=UNSIGNED,
+            max_pool_connections=max(32, MAX_WORKERS * 2),
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            tcp_keepalive=True,
+        )
+    )
+
+# UPDATED: Invariant parts of the Connection, Table and Column searches, built once at import. FluentSearch
+# methods return a copy, so each lookup adds its own predicates without modifying these.
+CONNECTION_SEARCH = (
+    FluentSearch()
+    .where(CompoundQuery.asset_type(Connection))
+    # UPDATED: Use EntityStatus.ACTIVE.value instead of hardcoded "ACTIVE"
+    .where(Asset.STATUS.eq(EntityStatus.ACTIVE.value))
+    # UPDATED: Only request the attributes that are read from the result
+    .include_on_results(Asset.NAME)
+    .include_on_results(Asset.QUALIFIED_NAME)
+    .page_size(1)
 )
-
-# Initialize the Atlan client
-client = AtlanClient(
-    base_url=config.BASE_URL,
-    api_key=config.API_TOKEN,
+TABLE_SEARCH = (
+    FluentSearch()
+    .where(CompoundQuery.asset_type(Table))
+    .where(Asset.STATUS.eq(EntityStatus.ACTIVE.value))
+    .include_on_results(Asset.NAME)  # Include name
+    .include_on_results(Asset.QUALIFIED_NAME)  # Include qualified_name
+    .page_size(1000)  # Adjust page size if necessary
 )
-
-# Initialize the S3 client for anonymous access
-s3_client = boto3.client(
-    's3',
-    config=Config(signature_version=UNSIGNED)
+COLUMN_SEARCH = (
+    FluentSearch()
+    .where(CompoundQuery.asset_type(Column))
+    .where(Asset.STATUS.eq(EntityStatus.ACTIVE.value))
+    .include_on_results(Asset.NAME)
+    .include_on_results(Column.DATA_TYPE)
+    .include_on_results(Column.ORDER)
+    .page_size(1000)
 )
 
+# UPDATED: On-disk cache of qualified names already found in Atlan, so re-runs can skip the existence checks.
+# Run with --refresh to clear it if assets are removed in Atlan.
+@functools.lru_cache(maxsize=None)
+def get_asset_cache():
+    """Return the on-disk asset cache, opening it on first use."""
+    return shelve.open(getattr(config, 'CACHE_PATH', 'atlan_asset_cache'))
+
+def asset_cache_key(key):
+    """Scope an asset cache key to the configured Atlan tenant, so a cache is never reused across instances."""
+    return f"{config.BASE_URL.rstrip('/')}|{key}"
+
+# UPDATED: Cache existence lookups for the duration of the run (also applied to the Database and Schema
+# lookups below), since the parent hierarchy never changes between CSV files
+@functools.lru_cache(maxsize=1024)
 def get_existing_connection(name):
     """Retrieve an existing Connection by name using Fluent Search."""
     try:
+        cache_key = asset_cache_key(f"Connection/{name.lower()}")
+        cached_qualified_name = get_asset_cache().get(cache_key)
+        if cached_qualified_name:
+            connection = Connection.ref_by_qualified_name(cached_qualified_name)
+            connection.name = name
+            return connection
+
         search = (
-            FluentSearch()
-            .where(CompoundQuery.asset_type(Connection))
-            # UPDATED: Use EntityStatus.ACTIVE.value instead of hardcoded "ACTIVE"
-            .where(Asset.STATUS.eq(EntityStatus.ACTIVE.value))
+            CONNECTION_SEARCH
             .where(Connection.NAME.eq(name, case_insensitive=True))
-            .page_size(1)
         ).to_request()
+        search.exclude_meanings = True
+        search.exclude_atlan_tags = True
 
-        search_results = client.asset.search(search)
+        search_results = get_client().asset.search(search)
 
-        for asset in search_results.current_page():
-            if isinstance(asset, Connection) and asset.name.lower() == name.lower():
-                return asset
+        # UPDATED: The search already matches the name case-insensitively, so return the first result as-is
+        page = search_results.current_page()
+        if page and isinstance(page[0], Connection):
+            get_asset_cache()[cache_key] = page[0].qualified_name
+            return page[0]
         return None
     except Exception as e:
-        logging.error(f"Error searching for Connection '{name}': {e}")
-        print(f"Error searching for Connection '{name}': {e}")
+        logging.error("Error searching for Connection '%s': %s", name, e)
         raise
 
+# UPDATED: Added function to retrieve an asset through the indexed qualified-name lookup instead of a search
+def get_active_asset_by_qualified_name(asset_type, qualified_name):
+    """Retrieve an ACTIVE asset of the given type by its qualified name, or None if it does not exist."""
+    if get_asset_cache().get(asset_cache_key(qualified_name)):
+        asset = asset_type.ref_by_qualified_name(qualified_name)
+        asset.name = qualified_name.rsplit('/', 1)[-1]
+        return asset
+    try:
+        asset = get_client().asset.get_by_qualified_name(
+            qualified_name=qualified_name,
+            asset_type=asset_type,
+            ignore_relationships=True,
+        )
+    except NotFoundError:
+        return None
+    if asset.status != EntityStatus.ACTIVE:
+        return None
+    get_asset_cache()[asset_cache_key(qualified_name)] = True
+    return asset
+
+# UPDATED: Resolve the $admin role GUID once per run
+@functools.lru_cache(maxsize=1)
+def get_admin_role_guid():
+    """Retrieve the GUID of the $admin role."""
+    get_client()  # RoleCache resolves roles through the default client, so make sure it exists
+    return RoleCache.get_id_for_name("$admin")
+
 def create_s3_connection():
     """Create or retrieve an existing S3 connection in Atlan."""
     try:
-        logging.info(f"Ensuring S3 connection '{config.AWS_CONNECTION_NAME}' exists.")
+        logging.info("Ensuring S3 connection '%s' exists.", config.AWS_CONNECTION_NAME)
         # Attempt to retrieve existing connection
         existing_connection = get_existing_connection(config.AWS_CONNECTION_NAME)
         if existing_connection:
-            logging.info(f"Found existing S3 Connection: {existing_connection.qualified_name}")
+            logging.info("Found existing S3 Connection: %s", existing_connection.qualified_name)
             return existing_connection.qualified_name
         else:
             # Create new connection
-            print(f"Creating S3 connection '{config.AWS_CONNECTION_NAME}'...")
-            admin_role_guid = RoleCache.get_id_for_name("$admin")
+            logging.info("Creating S3 connection '%s'.", config.AWS_CONNECTION_NAME)
+            admin_role_guid = get_admin_role_guid()
             connection = Connection.create(
                 name=config.AWS_CONNECTION_NAME,
                 connector_type=AtlanConnectorType.S3,
@@ -84,187 +202,126 @@ def create_s3_connection():
                 admin_groups=config.ADMIN_GROUPS,  # From config.py
                 admin_users=config.ADMIN_USERS,    # From config.py
             )
-            response = client.asset.save(connection)
+            response = get_client().asset.save(connection)
             if response and response.assets_created:
                 connection_asset = response.assets_created(asset_type=Connection)[0]
                 connection_qualified_name = connection_asset.qualified_name
-                print(f"Created S3 Connection with Qualified Name: {connection_qualified_name}")
-                logging.info(f"Created S3 Connection with Qualified Name: {connection_qualified_name}")
+                get_asset_cache()[asset_cache_key(f"Connection/{config.AWS_CONNECTION_NAME.lower()}")] = connection_qualified_name
+                logging.info("Created S3 Connection with Qualified Name: %s", connection_qualified_name)
                 return connection_qualified_name
             else:
-                logging.error(f"Failed to create S3 Connection '{config.AWS_CONNECTION_NAME}'.")
-                print(f"Failed to create S3 Connection '{config.AWS_CONNECTION_NAME}'.")
+                logging.error("Failed to create S3 Connection '%s'.", config.AWS_CONNECTION_NAME)
                 return None
     except Exception as e:
-        logging.error(f"Error ensuring S3 Connection: {e}")
-        print(f"Error ensuring S3 Connection: {e}")
+        logging.error("Error ensuring S3 Connection: %s", e)
         raise
 
+@functools.lru_cache(maxsize=1024)
 def get_existing_database(name, connection_qualified_name):
     """Retrieve an existing Database by name under a specific Connection."""
     try:
-        search = (
-            FluentSearch()
-            .where(CompoundQuery.asset_type(Database))
-            # UPDATED: Use EntityStatus.ACTIVE.value instead of hardcoded "ACTIVE"
-            .where(Asset.STATUS.eq(EntityStatus.ACTIVE.value))
-            .where(Database.NAME.eq(name, case_insensitive=True))
-            .where(Database.CONNECTION_QUALIFIED_NAME.eq(connection_qualified_name))
-            .page_size(1)
-        ).to_request()
-
-        search_results = client.asset.search(search)
-
-        for asset in search_results.current_page():
-            if isinstance(asset, Database) and asset.name.lower() == name.lower():
-                return asset
-        return None
+        # UPDATED: Databases, Schemas and Tables have deterministic qualified names, so look them up directly
+        return get_active_asset_by_qualified_name(Database, f"{connection_qualified_name}/{name}")
     except Exception as e:
-        logging.error(f"Error searching for Database '{name}': {e}")
-        print(f"Error searching for Database '{name}': {e}")
+        logging.error("Error searching for Database '%s': %s", name, e)
         raise
 
 def create_database(connection_qualified_name):
     """Create or retrieve an existing Database asset in Atlan."""
     try:
         database_name = config.DATABASE_NAME  # From config.py
-        logging.info(f"Ensuring Database '{database_name}' exists under Connection '{connection_qualified_name}'.")
+        logging.info("Ensuring Database '%s' exists under Connection '%s'.", database_name, connection_qualified_name)
 
         existing_database = get_existing_database(database_name, connection_qualified_name)
         if existing_database:
-            logging.info(f"Found existing Database: {existing_database.qualified_name}")
+            logging.info("Found existing Database: %s", existing_database.qualified_name)
             return existing_database
         else:
             # Create new Database
-            print(f"Creating Database '{database_name}' with connection qualified name '{connection_qualified_name}'...")
+            logging.info("Creating Database '%s' with connection qualified name '%s'.", database_name, connection_qualified_name)
             database = Database.create(
                 name=database_name,
                 connection_qualified_name=connection_qualified_name,
             )
-            response = client.asset.save(database)
+            response = get_client().asset.save(database)
             if response and response.assets_created:
                 database_asset = response.assets_created(asset_type=Database)[0]
-                print(f"Created Database '{database_name}' with qualified name '{database_asset.qualified_name}'.")
-                logging.info(f"Created Database '{database_name}' with qualified name '{database_asset.qualified_name}'.")
+                get_asset_cache()[asset_cache_key(database_asset.qualified_name)] = True
+                logging.info("Created Database '%s' with qualified name '%s'.", database_name, database_asset.qualified_name)
                 return database_asset
             else:
-                logging.error(f"Failed to create Database '{database_name}'.")
-                print(f"Failed to create Database '{database_name}'.")
+                logging.error("Failed to create Database '%s'.", database_name)
                 return None
     except Exception as e:
-        logging.error(f"Error ensuring Database: {e}")
-        print(f"Error ensuring Database: {e}")
+        logging.error("Error ensuring Database: %s", e)
         raise
 
+@functools.lru_cache(maxsize=1024)
 def get_existing_schema(name, database_qualified_name):
     """Retrieve an existing Schema by name under a specific Database."""
     try:
-        search = (
-            FluentSearch()
-            .where(CompoundQuery.asset_type(Schema))
-            # UPDATED: Use EntityStatus.ACTIVE.value instead of hardcoded "ACTIVE"
-            .where(Asset.STATUS.eq(EntityStatus.ACTIVE.value))
-            .where(Schema.NAME.eq(name, case_insensitive=True))
-            .where(Schema.DATABASE_QUALIFIED_NAME.eq(database_qualified_name))
-            .page_size(1)
-        ).to_request()
-
-        search_results = client.asset.search(search)
-
-        for asset in search_results.current_page():
-            if isinstance(asset, Schema) and asset.name.lower() == name.lower():
-                return asset
-        return None
+        return get_active_asset_by_qualified_name(Schema, f"{database_qualified_name}/{name}")
     except Exception as e:
-        logging.error(f"Error searching for Schema '{name}': {e}")
-        print(f"Error searching for Schema '{name}': {e}")
+        logging.error("Error searching for Schema '%s': %s", name, e)
         raise
 
 def create_schema(database_qualified_name):
     """Create or retrieve an existing Schema asset in Atlan."""
     try:
         schema_name = config.SCHEMA_NAME  # From config.py
-        logging.info(f"Ensuring Schema '{schema_name}' exists under Database '{database_qualified_name}'.")
+        logging.info("Ensuring Schema '%s' exists under Database '%s'.", schema_name, database_qualified_name)
 
         existing_schema = get_existing_schema(schema_name, database_qualified_name)
         if existing_schema:
-            logging.info(f"Found existing Schema: {existing_schema.qualified_name}")
+            logging.info("Found existing Schema: %s", existing_schema.qualified_name)
             return existing_schema
         else:
             # Create new Schema
-            print(f"Creating Schema '{schema_name}' under Database '{database_qualified_name}'...")
+            logging.info("Creating Schema '%s' under Database '%s'.", schema_name, database_qualified_name)
             schema = Schema.create(
                 name=schema_name,
                 database_qualified_name=database_qualified_name,
             )
-            response = client.asset.save(schema)
+            response = get_client().asset.save(schema)
             if response and response.assets_created:
                 schema_asset = response.assets_created(asset_type=Schema)[0]
-                print(f"Created Schema '{schema_name}' with qualified name '{schema_asset.qualified_name}'.")
-                logging.info(f"Created Schema '{schema_name}' with qualified name '{schema_asset.qualified_name}'.")
+                get_asset_cache()[asset_cache_key(schema_asset.qualified_name)] = True
+                logging.info("Created Schema '%s' with qualified name '%s'.", schema_name, schema_asset.qualified_name)
                 return schema_asset
             else:
-                logging.error(f"Failed to create Schema '{schema_name}'.")
-                print(f"Failed to create Schema '{schema_name}'.")
+                logging.error("Failed to create Schema '%s'.", schema_name)
                 return None
     except Exception as e:
-        logging.error(f"Error ensuring Schema: {e}")
-        print(f"Error ensuring Schema: {e}")
+        logging.error("Error ensuring Schema: %s", e)
         raise
 
-def get_existing_table(name, schema_qualified_name):
-    """Retrieve an existing Table by name under a specific Schema."""
-    try:
-        search = (
-            FluentSearch()
-            .where(CompoundQuery.asset_type(Table))
-            # UPDATED: Use EntityStatus.ACTIVE.value instead of hardcoded "ACTIVE"
-            .where(Asset.STATUS.eq(EntityStatus.ACTIVE.value))
-            .where(Table.NAME.eq(name, case_insensitive=True))
-            .where(Table.SCHEMA_QUALIFIED_NAME.eq(schema_qualified_name))
-            .page_size(1)
-        ).to_request()
-
-        search_results = client.asset.search(search)
-
-        for asset in search_results.current_page():
-            if isinstance(asset, Table) and asset.name.lower() == name.lower():
-                return asset
-        return None
-    except Exception as e:
-        logging.error(f"Error searching for Table '{name}': {e}")
-        print(f"Error searching for Table '{name}': {e}")
-        raise
-
-def create_table(table_name, schema_qualified_name):
+def create_table(table_name, schema_qualified_name, existing_tables):
     """Create or retrieve an existing Table asset in Atlan."""
     try:
-        logging.info(f"Ensuring Table '{table_name}' exists under Schema '{schema_qualified_name}'.")
+        logging.info("Ensuring Table '%s' exists under Schema '%s'.", table_name, schema_qualified_name)
 
-        existing_table = get_existing_table(table_name, schema_qualified_name)
+        # UPDATED: Check the Tables fetched once up front by get_existing_tables instead of searching per CSV file
+        existing_table = existing_tables.get(table_name)
         if existing_table:
-            logging.info(f"Found existing Table: {existing_table.qualified_name}")
+            logging.info("Found existing Table: %s", existing_table.qualified_name)
             return existing_table
         else:
             # Create new Table
-            print(f"Creating Table '{table_name}' under Schema '{schema_qualified_name}'...")
+            logging.info("Creating Table '%s' under Schema '%s'.", table_name, schema_qualified_name)
             table = Table.create(
                 name=table_name,
                 schema_qualified_name=schema_qualified_name,
             )
-            response = client.asset.save(table)
+            response = get_client().asset.save(table)
             if response and response.assets_created:
                 table_asset = response.assets_created(asset_type=Table)[0]
-                print(f"Created Table '{table_name}' with qualified name '{table_asset.qualified_name}'.")
-                logging.info(f"Created Table '{table_name}' with qualified name '{table_asset.qualified_name}'.")
+                logging.info("Created Table '%s' with qualified name '%s'.", table_name, table_asset.qualified_name)
                 return table_asset
             else:
-                logging.error(f"Failed to create Table '{table_name}'.")
-                print(f"Failed to create Table '{table_name}'.")
+                logging.error("Failed to create Table '%s'.", table_name)
                 return None
     except Exception as e:
-        logging.error(f"Error ensuring Table: {e}")
-        print(f"Error ensuring Table: {e}")
+        logging.error("Error ensuring Table: %s", e)
         raise
 
 # UPDATED: Added function to list S3 objects dynamically using prefix or pattern
@@ -272,7 +329,7 @@ def list_s3_objects():
     """List S3 objects using prefix or pattern from config."""
     try:
         # Using prefix to list objects
-        response = s3_client.list_objects_v2(
+        response = get_s3_client().list_objects_v2(
             Bucket=config.S3_BUCKET_NAME,
             Prefix=config.S3_OBJECT_PREFIX
         )
@@ -286,8 +343,7 @@ def list_s3_objects():
         else:
             return objects
     except Exception as e:
-        logging.error(f"Error listing S3 objects: {e}")
-        print(f"Error listing S3 objects: {e}")
+        logging.error("Error listing S3 objects: %s", e)
         raise
 
 # UPDATED: Added function to retrieve existing tables under a specific Schema
@@ -296,24 +352,39 @@ def get_existing_tables(schema_qualified_name):
     try:
         existing_tables = {}
         search = (
-            FluentSearch()
-            .where(CompoundQuery.asset_type(Table))
-            .where(Asset.STATUS.eq(EntityStatus.ACTIVE.value))
+            TABLE_SEARCH
             .where(Table.SCHEMA_QUALIFIED_NAME.eq(schema_qualified_name))
-            .include_on_results(Asset.NAME)  # Include name
-            .include_on_results(Asset.QUALIFIED_NAME)  # Include qualified_name
-            .page_size(1000)  # Adjust page size if necessary
         ).to_request()
+        # UPDATED: Skip term and tag hydration, which is never read from the results
+        search.exclude_meanings = True
+        search.exclude_atlan_tags = True
 
-        search_results = client.asset.search(search)
+        search_results = get_client().asset.search(search)
 
         for asset in search_results:
             if isinstance(asset, Table):
                 existing_tables[asset.name] = asset
         return existing_tables
     except Exception as e:
-        logging.error(f"Error retrieving existing tables: {e}")
-        print(f"Error retrieving existing tables: {e}")
+        logging.error("Error retrieving existing tables: %s", e)
+        raise
+
+# UPDATED: Added function to retrieve existing Columns of a Table with their data types and order
+def get_existing_columns(table_qualified_name):
+    """Retrieve existing Columns under a specific Table, keyed by name."""
+    try:
+        search = (
+            COLUMN_SEARCH
+            .where(Column.TABLE_QUALIFIED_NAME.eq(table_qualified_name))
+        ).to_request()
+        search.exclude_meanings = True
+        search.exclude_atlan_tags = True
+
+        search_results = get_client().asset.search(search)
+
+        return {asset.name: asset for asset in search_results if isinstance(asset, Column)}
+    except Exception as e:
+        logging.error("Error retrieving existing columns for Table '%s': %s", table_qualified_name, e)
         raise
 
 # UPDATED: Added function to delete tables that are no longer present in S3
@@ -323,16 +394,13 @@ def delete_tables(tables):
         if not tables:
             return
         for table in tables:
-            print(f"Marking table '{table.name}' as DELETED.")
-            logging.info(f"Marking table '{table.name}' as DELETED.")
+            logging.info("Marking table '%s' as DELETED.", table.name)
             table.status = EntityStatus.DELETED.value
-        response = client.asset.save(tables)
+        response = get_client().asset.save(tables)
         if response:
-            print(f"Marked {len(tables)} tables as DELETED.")
-            logging.info(f"Marked {len(tables)} tables as DELETED.")
+            logging.info("Marked %s tables as DELETED.", len(tables))
     except Exception as e:
-        logging.error(f"Error deleting tables: {e}")
-        print(f"Error deleting tables: {e}")
+        logging.error("Error deleting tables: %s", e)
         raise
 
 # UPDATED: Added function to generate consistent table names from CSV file keys
@@ -342,158 +410,189 @@ def generate_table_name(csv_file_key):
     table_name = csv_file_key.replace('/', '_').replace('.csv', '')
     return table_name
 
-def extract_and_create_columns(csv_file_key, schema_qualified_name):
-    """Extract schema from S3 CSV file and create Table and Column assets in Atlan."""
+# UPDATED: Added function to infer column types from sampled CSV values without pandas
+def infer_python_type(values):
+    """Infer the narrowest type (int, float, bool or str) that fits all non-empty sampled values."""
+    values = [value for value in values if value != '']
+    if not values:
+        return str
+    for python_type, pattern in ((int, INT_PATTERN), (float, FLOAT_PATTERN)):
+        if all(pattern.fullmatch(value.strip()) for value in values):
+            return python_type
+    if all(value.lower() in ('true', 'false') for value in values):
+        return bool
+    return str
+
+# UPDATED: Added function to fetch the sampled bytes of a CSV file, so S3 reads can be prefetched
+def fetch_csv_sample(csv_file_key):
+    """
+    Fetch a sample of a CSV file from S3, trimmed to whole rows.
+    The sample starts at CSV_SAMPLE_BYTES and doubles, up to CSV_SAMPLE_MAX_BYTES, until it holds the header row.
+    """
     try:
-        print(f"\nProcessing CSV file: {csv_file_key}")
-        logging.info(f"Starting processing of CSV file: {csv_file_key}")
         bucket_name = config.S3_BUCKET_NAME
+        logging.info("Fetching CSV file '%s' from bucket '%s'.", csv_file_key, bucket_name)
+        # UPDATED: Only fetch the start of the object with an HTTP range; the header and a sample of rows are
+        # enough to extract column names and infer data types
+        sample_bytes = CSV_SAMPLE_BYTES
+        while True:
+            obj = get_s3_client().get_object(
+                Bucket=bucket_name,
+                Key=csv_file_key,
+                Range=f"bytes=0-{sample_bytes - 1}",
+            )
+            csv_sample = obj['Body'].read()
+            if len(csv_sample) < sample_bytes:
+                # The whole file fit in the range
+                return csv_sample
+            last_newline = csv_sample.rfind(b'\n')
+            if last_newline != -1:
+                # The range cut the file short, so drop the trailing partial row
+                return csv_sample[:last_newline + 1]
+            if sample_bytes >= CSV_SAMPLE_MAX_BYTES:
+                raise ValueError(f"header row is longer than {CSV_SAMPLE_MAX_BYTES} bytes")
+            # The header row alone is longer than the range, so widen it
+            sample_bytes = min(sample_bytes * 2, CSV_SAMPLE_MAX_BYTES)
+            logging.debug("Header of CSV file '%s' is longer than the sample; fetching %s bytes.", csv_file_key, sample_bytes)
+    except Exception as e:
+        logging.error("Error fetching CSV file '%s': %s", csv_file_key, e)
+        raise
 
-        # Fetch the CSV file from S3
-        print(f"Fetching CSV file '{csv_file_key}' from bucket '{bucket_name}'...")
-        logging.info(f"Fetching CSV file '{csv_file_key}' from bucket '{bucket_name}'.")
-        obj = s3_client.get_object(Bucket=bucket_name, Key=csv_file_key)
-        csv_content = obj['Body'].read().decode('utf-8')
+def extract_and_create_columns(csv_file_key, schema_qualified_name, csv_sample, existing_tables):
+    """Extract schema from a sampled S3 CSV file and create Table and Column assets in Atlan."""
+    try:
+        logging.info("Starting processing of CSV file: %s", csv_file_key)
 
-        # Use pandas to read the CSV file
-        df = pd.read_csv(StringIO(csv_content))  # Read the entire file
+        # UPDATED: Parse the sample with the csv module instead of pandas; only the header and a sample of rows
+        # are needed
+        reader = csv.reader(StringIO(csv_sample.decode('utf-8-sig')))
+        headers = next(reader, [])
 
         # Get column names and filter out unnamed columns
-        column_names = [col for col in df.columns if not col.startswith('Unnamed')]
-        print(f"Extracted column names: {column_names}")
-        logging.info(f"Extracted column names: {column_names}")
+        named_columns = [(idx, col) for idx, col in enumerate(headers) if col and not col.startswith('Unnamed')]
+        # Rename duplicate headers the way pandas did ('a', 'a.1', ...), so each Column gets its own qualified name
+        header_names = set(col for _, col in named_columns)
+        used_names = set()
+        for position, (idx, col) in enumerate(named_columns):
+            if col in used_names:
+                suffix = 1
+                while f"{col}.{suffix}" in header_names:
+                    suffix += 1
+                logging.warning("Duplicate column '%s' in '%s'; renaming it to '%s.%s'.", col, csv_file_key, col, suffix)
+                col = f"{col}.{suffix}"
+                header_names.add(col)
+                named_columns[position] = (idx, col)
+            used_names.add(col)
+        column_names = [col for _, col in named_columns]
+        logging.info("Extracted column names: %s", column_names)
 
         if not column_names:
-            print(f"No valid columns found in '{csv_file_key}'. Skipping.")
-            logging.warning(f"No valid columns found in '{csv_file_key}'. Skipping.")
+            logging.warning("No valid columns found in '%s'. Skipping.", csv_file_key)
             return
 
-        # Get data types
-        data_types = df.dtypes
-
-        # Map pandas data types to Atlan data types
-        pandas_to_atlan_types = {
-            'int64': 'bigint',
-            'int32': 'int',
-            'float64': 'double',
-            'float32': 'float',
-            'object': 'string',
-            'bool': 'boolean',
-            'datetime64[ns]': 'timestamp',
-            'timedelta[ns]': 'interval',
-            # Add more mappings as needed
-        }
-
-        column_type_mapping = {}
-        for col_name in column_names:
-            pandas_type = str(data_types[col_name])
-            atlan_type = pandas_to_atlan_types.get(pandas_type, 'string')  # Default to 'string' if not found
-            column_type_mapping[col_name] = atlan_type
+        # UPDATED: Only parse the sampled rows when data type inference is enabled
+        if getattr(config, 'INFER_TYPES', True):
+            sample_rows = list(itertools.islice(reader, CSV_SAMPLE_ROWS))
+            column_type_mapping = {
+                col_name: PYTHON_TO_ATLAN_TYPES[infer_python_type([row[idx] for row in sample_rows if idx < len(row)])]
+                for idx, col_name in named_columns
+            }
+        else:
+            column_type_mapping = {col_name: 'string' for col_name in column_names}
 
         # Create or retrieve Table asset
         # UPDATED: Use generate_table_name to ensure consistent table naming
         table_name = generate_table_name(csv_file_key)
-        table_asset = create_table(table_name, schema_qualified_name)
+        table_asset = create_table(table_name, schema_qualified_name, existing_tables)
         if not table_asset:
-            print(f"Failed to create or retrieve Table '{table_name}'. Skipping columns creation.")
-            logging.error(f"Failed to create or retrieve Table '{table_name}'. Skipping columns creation.")
+            logging.error("Failed to create or retrieve Table '%s'. Skipping columns creation.", table_name)
             return
 
-        # Step 1: Create Column assets without 'data_type' and save them
+        # UPDATED: For Tables that already existed, fetch their Columns so unchanged ones are not saved again
+        existing_columns = {}
+        if table_name in existing_tables:
+            existing_columns = get_existing_columns(table_asset.qualified_name)
+
+        # UPDATED: Create Column assets with 'data_type' already set so a single save creates or updates them
         column_assets = []
         for idx, col_name in enumerate(column_names, start=1):
-            logging.info(f"Creating Column '{col_name}' (order {idx}) under Table '{table_name}'.")
-            print(f"Creating Column '{col_name}' (order {idx}) under Table '{table_name}'...")
+            col_data_type = column_type_mapping[col_name]
+            existing_column = existing_columns.get(col_name)
+            if existing_column and existing_column.data_type == col_data_type and existing_column.order == idx:
+                logging.debug("Column '%s' of Table '%s' is unchanged. Skipping update.", col_name, table_name)
+                continue
+            logging.info("Creating Column '%s' (order %s, data_type '%s') under Table '%s'.", col_name, idx, col_data_type, table_name)
             column = Column.create(
                 name=col_name,
                 parent_qualified_name=table_asset.qualified_name,
                 parent_type=Table,
                 order=idx,
             )
+            column.data_type = col_data_type
             column_assets.append(column)
 
-        # Save all new columns at once
-        if column_assets:
-            response = client.asset.save(column_assets)
-            if response and response.assets_created:
-                print(f"Created {len(response.assets_created(asset_type=Column))} columns for Table '{table_name}'.")
-                logging.info(f"Created {len(response.assets_created(asset_type=Column))} columns for Table '{table_name}'.")
-            else:
-                print(f"Failed to create columns for Table '{table_name}'.")
-                logging.error(f"Failed to create columns for Table '{table_name}'.")
-                return  # Exit if columns creation failed
-
-        # Step 2: Update each Column with 'data_type'
-        for col_name in column_names:
-            col_data_type = column_type_mapping.get(col_name, 'string')
-            logging.info(f"Updating data_type for Column '{col_name}' to '{col_data_type}'.")
-            print(f"Updating data_type for Column '{col_name}' to '{col_data_type}'.")
-
-            # Build the qualified name of the Column
-            column_qualified_name = f"{table_asset.qualified_name}/{col_name}"
-
-            try:
-                # Retrieve the existing column
-                column = client.get_asset_by_qualified_name(asset_type=Column, qualified_name=column_qualified_name)
-                if column:
-                    logging.info(f"Retrieved Column '{column.name}' with current data type '{column.data_type}'.")
-                    print(f"Retrieved Column '{column.name}' with current data type '{column.data_type}'.")
-
-                    # UPDATED: Only update the data_type if it has changed
-                    if column.data_type != col_data_type:
-                        column.data_type = col_data_type
-
-                        # Save the updated column
-                        update_response = client.asset.save(column)
-                        if update_response:
-                            print(f"Updated Column '{col_name}' with data_type '{col_data_type}'.")
-                            logging.info(f"Updated Column '{col_name}' with data_type '{col_data_type}'.")
-                        else:
-                            print(f"Failed to update data_type for Column '{col_name}'.")
-                            logging.error(f"Failed to update data_type for Column '{col_name}'.")
-                    else:
-                        print(f"Column '{col_name}' already has data_type '{col_data_type}'. Skipping update.")
-                        logging.info(f"Column '{col_name}' already has data_type '{col_data_type}'. Skipping update.")
-                else:
-                    print(f"Column with qualified name '{column_qualified_name}' not found.")
-                    logging.error(f"Column with qualified name '{column_qualified_name}' not found.")
-            except Exception as e:
-                logging.error(f"An error occurred while updating the column '{col_name}': {e}")
-                print(f"An error occurred while updating the column '{col_name}': {e}")
+        if not column_assets:
+            logging.info("All %s columns of Table '%s' are unchanged.", len(column_names), table_name)
+            return
+
+        # Save all columns at once
+        response = get_client().asset.save(column_assets)
+        if response and (response.assets_created(asset_type=Column) or response.assets_updated(asset_type=Column)):
+            created_count = len(response.assets_created(asset_type=Column))
+            updated_count = len(response.assets_updated(asset_type=Column))
+            logging.info("Created %s and updated %s columns for Table '%s'.", created_count, updated_count, table_name)
+        else:
+            logging.error("Failed to create columns for Table '%s'.", table_name)
 
     except Exception as e:
-        logging.error(f"Error processing CSV file '{csv_file_key}': {e}")
-        print(f"Error processing CSV file '{csv_file_key}': {e}")
+        logging.error("Error processing CSV file '%s': %s", csv_file_key, e)
         raise
 
 def main():
+    parser = argparse.ArgumentParser(description="Ingest CSV files from S3 into Atlan as Tables and Columns.")
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help="Clear the on-disk cache of existing assets and re-check everything against Atlan.",
+    )
+    args = parser.parse_args()
+
+    # Configure logging
+    # UPDATED: Echo log records to the console so each message is written once instead of print() + logging,
+    # and configure logging here rather than at import time so importing this module has no side effects
+    logging.basicConfig(
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        level=getattr(logging, config.LOG_LEVEL.upper()),
+        handlers=[logging.FileHandler(config.LOG_FILE, mode='a'), logging.StreamHandler(sys.stdout)],
+    )
+
     try:
+        if args.refresh:
+            logging.info("Clearing the asset cache.")
+            get_asset_cache().clear()
+
         # Ensure the S3 connection exists
         connection_qualified_name = create_s3_connection()
         if not connection_qualified_name:
-            print("Failed to create or retrieve S3 Connection.")
             logging.error("Failed to create or retrieve S3 Connection.")
             return
 
         # Create or retrieve Database
         database_asset = create_database(connection_qualified_name)
         if not database_asset:
-            print("Failed to create or retrieve Database.")
             logging.error("Failed to create or retrieve Database.")
             return
 
         # Create or retrieve Schema
         schema_asset = create_schema(database_asset.qualified_name)
         if not schema_asset:
-            print("Failed to create or retrieve Schema.")
             logging.error("Failed to create or retrieve Schema.")
             return
 
         # UPDATED: List CSV files from S3 bucket using dynamic listing
         csv_files = list_s3_objects()
         if not csv_files:
-            print(f"No CSV files found in bucket '{config.S3_BUCKET_NAME}' matching the pattern.")
-            logging.warning(f"No CSV files found in bucket '{config.S3_BUCKET_NAME}' matching the pattern.")
+            logging.warning("No CSV files found in bucket '%s' matching the pattern.", config.S3_BUCKET_NAME)
             return
 
         # UPDATED: Generate the current set of table names from S3
@@ -509,21 +608,41 @@ def main():
         if tables_to_delete:
             delete_tables(tables_to_delete)
 
-        # Process current CSV files
-        for csv_file_key in csv_files:
-            extract_and_create_columns(csv_file_key, schema_asset.qualified_name)
+        # UPDATED: Process current CSV files concurrently; each file's S3 fetch and Atlan saves are independent
+        logging.info("Processing %s CSV files with up to %s workers...", len(csv_files), MAX_WORKERS)
+        # UPDATED: Prefetch the S3 samples on a separate pool so S3 reads overlap with the Atlan saves
+        with ThreadPoolExecutor(max_workers=S3_PREFETCH_WORKERS) as prefetcher, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Bound the look-ahead: a sample takes a slot before it is fetched and frees it once its file is
+            # processed, so at most one sample per worker plus one per prefetch thread is held in memory
+            prefetch_slots = threading.Semaphore(MAX_WORKERS + S3_PREFETCH_WORKERS)
+
+            def prefetch_csv_sample(csv_file_key):
+                prefetch_slots.acquire()
+                return fetch_csv_sample(csv_file_key)
+
+            def process_csv_file(csv_file_key):
+                try:
+                    extract_and_create_columns(
+                        csv_file_key, schema_asset.qualified_name, csv_samples.pop(csv_file_key).result(), existing_tables
+                    )
+                finally:
+                    prefetch_slots.release()
+
+            csv_samples = {csv_file_key: prefetcher.submit(prefetch_csv_sample, csv_file_key) for csv_file_key in csv_files}
+            list(executor.map(process_csv_file, csv_files))
 
-        print("\nSchema extraction and update completed.")
         logging.info("Schema extraction and update completed.")
-        print("\nTo view the assets in Atlan:")
-        print(f"- Connection: {config.AWS_CONNECTION_NAME}")
-        print(f"- Database: {database_asset.name}")
-        print(f"- Schema: {schema_asset.name}")
-        print("- Tables and Columns are under the Schema.")
+        logging.info("To view the assets in Atlan:")
+        logging.info("- Connection: %s", config.AWS_CONNECTION_NAME)
+        logging.info("- Database: %s", database_asset.name)
+        logging.info("- Schema: %s", schema_asset.name)
+        logging.info("- Tables and Columns are under the Schema.")
 
     except Exception as e:
-        logging.error(f"An unexpected error occurred: {e}")
-        print(f"An unexpected error occurred: {e}")
+        logging.error("An unexpected error occurred: %s", e)
+    finally:
+        get_asset_cache().close()
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,10 @@
+import argparse
 import logging
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pyatlan.client.atlan import AtlanClient
 from pyatlan.model.assets import Connection, Table, Column, Process, ColumnProcess
 from pyatlan.model.fluent_search import FluentSearch
@@ -19,59 +24,136 @@ client = AtlanClient(
     api_key=config.API_TOKEN
 )
 
+# Number of tables whose columns are fetched per search
+COLUMN_FETCH_BATCH_SIZE = 50
+# Number of column searches run concurrently, on a pool separate from the lineage work
+COLUMN_FETCH_WORKERS = 4
+# Number of candidate qualified names checked for existing lineage per search
+EXISTENCE_CHECK_BATCH_SIZE = 1000
+# Number of Process or ColumnProcess entities saved per request
+SAVE_BATCH_SIZE = 50
+
+# Invariant parts of each search, built once; every FluentSearch builder method returns a copy, so these are never mutated
+# Only the attributes that are read from the results are requested
+CONNECTION_SEARCH = (
+    FluentSearch()
+    .where(FluentSearch.active_assets())
+    .where(FluentSearch.asset_type(Connection))
+    .include_on_results(Connection.QUALIFIED_NAME)
+    .page_size(1)
+)
+TABLE_SEARCH = (
+    FluentSearch()
+    .where(FluentSearch.asset_type(Table))
+    .where(FluentSearch.active_assets())
+    .include_on_results(Table.NAME)
+    .include_on_results(Table.QUALIFIED_NAME)
+    .page_size(1000)
+)
+COLUMN_SEARCH = (
+    FluentSearch()
+    .where(FluentSearch.active_assets())
+    .where(FluentSearch.asset_type(Column))
+    .include_on_results(Column.NAME)
+    .include_on_results(Column.QUALIFIED_NAME)
+    .include_on_results(Column.TABLE_QUALIFIED_NAME)
+    .page_size(1000)
+)
+LINEAGE_SEARCHES = {
+    asset_type: (
+        FluentSearch()
+        .where(FluentSearch.active_assets())
+        .where(FluentSearch.asset_type(asset_type))
+        .include_on_results(asset_type.NAME)
+        .include_on_results(asset_type.QUALIFIED_NAME)
+        .page_size(1000)
+    )
+    for asset_type in (Process, ColumnProcess)
+}
+
+def configure_http_session(pool_size):
+    """
+    Mounts a pooled, retrying HTTP adapter on the Atlan client's session.
+    :param pool_size: Maximum number of concurrent requests the pool should keep connections for.
+    """
+    # Back off on throttling (429) as well as the SDK's default retry statuses,
+    # waiting as long as the server asks for via Retry-After when it sends one
+    http_adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[403, 429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    client._session.mount("https://", http_adapter)
+    client._session.mount("http://", http_adapter)
+    client._session.headers["Connection"] = "keep-alive"
+
+# Qualified names of the connections resolved so far, keyed by connection name
+_CONN_QN_CACHE = {}
+
+# Default for arguments where None is a meaningful value, e.g. a connection that was looked up and not found
+_UNSET = object()
+
 def get_connection_qualified_name(connection_name):
     """Retrieve the qualified name of the specified connection."""
+    # Only found connections are cached, so a connection created mid-run is still picked up
+    if connection_name in _CONN_QN_CACHE:
+        return _CONN_QN_CACHE[connection_name]
     try:
-        search_request = (
-            FluentSearch()
-            .where(FluentSearch.active_assets())
-            .where(FluentSearch.asset_type(Connection))
-            .where(Connection.NAME.eq(connection_name))
-            .page_size(1)
-            .to_request()
-        )
+        search_request = CONNECTION_SEARCH.where(Connection.NAME.eq(connection_name)).to_request()
         connections = client.asset.search(search_request)
         for connection in connections.current_page():
+            _CONN_QN_CACHE[connection_name] = connection.qualified_name
             return connection.qualified_name
         return None
     except Exception as e:
-        logging.error(f"Error retrieving qualified name for connection '{connection_name}': {e}")
+        logging.error("Error retrieving qualified name for connection '%s': %s", connection_name, e)
         raise
 
-def search_tables_in_connection(connection_name):
+def search_tables_in_connection(connection_name, connection_qualified_name=_UNSET):
     """
     Searches for all table assets in Atlan under a given connection.
     :param connection_name: Name of the connection.
-    :return: A list of Table assets.
+    :param connection_qualified_name: Qualified name of the connection, if already looked up (None if not found).
+    :return: Dictionary mapping case-folded table name to its Table asset.
     """
     try:
-        # First, get the connection qualified name
-        connection_qualified_name = get_connection_qualified_name(connection_name)
+        # First, get the connection qualified name, unless the caller already resolved it
+        if connection_qualified_name is _UNSET:
+            connection_qualified_name = get_connection_qualified_name(connection_name)
         if not connection_qualified_name:
-            logging.warning(f"Connection '{connection_name}' not found.")
-            return []
+            logging.warning("Connection '%s' not found.", connection_name)
+            return {}
 
         # Search for tables under this connection
-        search = (
-            FluentSearch()
-            .where(Table.CONNECTION_QUALIFIED_NAME.eq(connection_qualified_name))
-            .where(FluentSearch.active_assets())
-            .page_size(1000)
-        ).to_request()
+        search = TABLE_SEARCH.where(Table.CONNECTION_QUALIFIED_NAME.eq(connection_qualified_name)).to_request()
 
         search_results = client.asset.search(search)
-        tables = [asset for asset in search_results.current_page() if isinstance(asset, Table)]
-        logging.info(f"Found {len(tables)} tables under connection '{connection_name}'.")
-        print(f"\nFound {len(tables)} tables under connection '{connection_name}':")
-        for table in tables:
-            print(f" - Table Name: {table.name}, GUID: {table.guid}, Qualified Name: {table.qualified_name}")
-        return tables
+        # Iterate the full results so tables beyond the first page are not dropped,
+        # mapping table names to Table assets (case-insensitive) as they stream in
+        table_dict = {}
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        for table in search_results:
+            table_dict[table.name.casefold()] = table
+            if debug_enabled:
+                logging.debug(" - Table Name: %s, GUID: %s, Qualified Name: %s", table.name, table.guid, table.qualified_name)
+        logging.info("Found %s tables under connection '%s'.", len(table_dict), connection_name)
+        print(f"\nFound {len(table_dict)} tables under connection '{connection_name}'.")
+        return table_dict
     except Exception as e:
-        logging.error(f"Error occurred while searching for tables under connection '{connection_name}': {e}")
-        return []
+        logging.error("Error occurred while searching for tables under connection '%s': %s", connection_name, e)
+        return {}
 
-def confirm_proceed(message):
-    """Prompt the user to confirm proceeding."""
+def confirm_proceed(message, assume_yes=False):
+    """Prompt the user to confirm proceeding, unless assume_yes is set."""
+    if assume_yes:
+        return True
     while True:
         user_input = input(f"{message} (Y/n): ").strip().lower()
         if user_input in ['y', 'yes', '']:
@@ -81,73 +163,59 @@ def confirm_proceed(message):
         else:
             print("Invalid input. Please enter 'Y' or 'n'.")
 
-def get_process_by_qualified_name(qualified_name):
-    """Retrieve a Process asset by its qualified_name."""
+def fetch_existing_processes(qualified_names, asset_type):
+    """
+    Retrieves whichever of the given Process or ColumnProcess qualified names already exist, in a single paged search.
+    :param qualified_names: Candidate qualified names to look up.
+    :param asset_type: Process or ColumnProcess.
+    :return: Dictionary mapping qualified_name to the existing asset.
+    """
     try:
-        search_request = (
-            FluentSearch()
-            .where(FluentSearch.active_assets())
-            .where(FluentSearch.asset_type(Process))
-            .where(Process.QUALIFIED_NAME.eq(qualified_name))
-            .page_size(1)
-            .to_request()
-        )
+        search_request = LINEAGE_SEARCHES[asset_type].where(asset_type.QUALIFIED_NAME.within(qualified_names)).to_request()
         search_results = client.asset.search(search_request)
-        processes = [asset for asset in search_results.current_page() if isinstance(asset, Process)]
-        if processes:
-            return processes[0]
-        else:
-            return None
+        existing = {asset.qualified_name: asset for asset in search_results if isinstance(asset, asset_type)}
+        logging.info("Found %s of %s %s assets already existing.", len(existing), len(qualified_names), asset_type.__name__)
+        return existing
     except Exception as e:
-        logging.error(f"Error occurred while searching for Process with qualified_name '{qualified_name}': {e}")
-        return None
+        logging.error("Error occurred while looking up %s existing %s assets: %s", len(qualified_names), asset_type.__name__, e)
+        return {}
 
-def get_column_process_by_qualified_name(qualified_name):
-    """Retrieve a ColumnProcess asset by its qualified_name."""
-    try:
-        search_request = (
-            FluentSearch()
-            .where(FluentSearch.active_assets())
-            .where(FluentSearch.asset_type(ColumnProcess))
-            .where(ColumnProcess.QUALIFIED_NAME.eq(qualified_name))
-            .page_size(1)
-            .to_request()
-        )
-        search_results = client.asset.search(search_request)
-        column_processes = [asset for asset in search_results.current_page() if isinstance(asset, ColumnProcess)]
-        if column_processes:
-            return column_processes[0]
-        else:
-            return None
-    except Exception as e:
-        logging.error(f"Error occurred while searching for ColumnProcess with qualified_name '{qualified_name}': {e}")
-        return None
+def find_existing_processes(executor, processes, asset_type):
+    """
+    Looks up which of the built Process or ColumnProcess entities already exist, batching the qualified names concurrently.
+    :param executor: Executor to run the lookup batches on.
+    :param processes: Unsaved Process or ColumnProcess entities.
+    :param asset_type: Process or ColumnProcess.
+    :return: Dictionary mapping qualified_name to the existing asset.
+    """
+    qualified_names = [process.qualified_name for process in processes]
+    futures = [
+        executor.submit(fetch_existing_processes, qualified_names[i:i + EXISTENCE_CHECK_BATCH_SIZE], asset_type)
+        for i in range(0, len(qualified_names), EXISTENCE_CHECK_BATCH_SIZE)
+    ]
+    existing = {}
+    for future in futures:
+        existing.update(future.result())
+    return existing
 
 def generate_process_id(source_qualified_name, target_qualified_name):
     """Generate a unique process_id based on source and target qualified names."""
     combined = f"{source_qualified_name}|{target_qualified_name}"
     return hashlib.md5(combined.encode('utf-8')).hexdigest()
 
-def set_table_lineage(source_table: Table, target_table: Table, connection_qualified_name: str, connection_name: str):
+def build_table_process(source_table: Table, target_table: Table, connection_name: str):
     """
-    Sets lineage between two tables in Atlan using Process entities.
+    Builds a Process entity representing lineage between two tables in Atlan.
     :param source_table: Source Table asset.
     :param target_table: Target Table asset.
-    :param connection_qualified_name: Qualified name of the connection to associate with the process.
-    :param connection_name: Name of the connection.
+    :param connection_name: Name of the connection to associate with the process; it must already be resolved.
+    :return: The unsaved Process, or None if it could not be built.
     """
     try:
+        connection_qualified_name = _CONN_QN_CACHE[connection_name]
         process_name = f"{source_table.name} -> {target_table.name}"
+        # The process_id is deterministic, so the Process's qualified_name can be used to find an existing one
         process_id = f"process_{generate_process_id(source_table.qualified_name, target_table.qualified_name)}"
-        # Construct the expected qualified_name based on default pattern
-        process_qualified_name = f"{connection_qualified_name}/{process_id}"
-
-        # Check if Process with this qualified_name already exists
-        existing_process = get_process_by_qualified_name(process_qualified_name)
-        if existing_process:
-            logging.info(f"Process with qualified_name '{process_qualified_name}' already exists. Using existing Process.")
-            print(f"Process lineage from '{source_table.name}' (Connection: {connection_name}) to '{target_table.name}' (Connection: {connection_name}) already exists.")
-            return existing_process.guid, existing_process.qualified_name
 
         # Create Process entity
         process = Process.creator(
@@ -159,49 +227,28 @@ def set_table_lineage(source_table: Table, target_table: Table, connection_quali
         )
         # Set additional attributes
         process.description = f"Lineage from {source_table.name} to {target_table.name}"
-        # Save the Process entity to establish lineage
-        response = client.asset.save(process)
-        if response and response.assets_created(asset_type=Process):
-            # Extract the GUID and qualified_name of the created Process
-            processes = response.assets_created(asset_type=Process)
-            process_guid = processes[0].guid
-            process_qualified_name = processes[0].qualified_name
-            logging.info(f"Successfully created lineage with Process GUID '{process_guid}'.")
-            print(f"Successfully created lineage from '{source_table.name}' (Connection: {connection_name}) to '{target_table.name}' (Connection: {connection_name}).")
-            return process_guid, process_qualified_name
-        else:
-            logging.error(f"Failed to create lineage from '{source_table.name}' to '{target_table.name}'.")
-            print(f"Failed to create lineage from '{source_table.name}' to '{target_table.name}'.")
-            return None, None
+        return process
     except Exception as e:
-        logging.error(f"Error occurred while setting table lineage: {e}")
-        print(f"Error occurred while setting table lineage: {e}")
-        return None, None
+        logging.error("Error occurred while building table lineage: %s", e)
+        print(f"Error occurred while building table lineage: {e}")
+        return None
 
-def set_column_lineage(source_column: Column, target_column: Column, parent_process_guid: str, parent_process_qualified_name: str):
+def build_column_process(source_column: Column, target_column: Column, parent_process_guid: str, parent_process_qualified_name: str):
     """
-    Sets lineage between two columns in Atlan using ColumnProcess entities.
+    Builds a ColumnProcess entity representing lineage between two columns in Atlan.
     :param source_column: Source Column asset.
     :param target_column: Target Column asset.
     :param parent_process_guid: GUID of the parent Process.
     :param parent_process_qualified_name: Qualified name of the parent Process.
+    :return: The unsaved ColumnProcess, or None if it could not be built.
     """
     try:
-        column_process_name = f"{source_column.name} -> {target_column.name}"
-        process_id = f"column_process_{generate_process_id(source_column.qualified_name, target_column.qualified_name)}"
-        # Construct the expected qualified_name
-        column_process_qualified_name = f"{parent_process_qualified_name}/{process_id}"
-
-        # Check if ColumnProcess with this qualified_name already exists
-        existing_column_process = get_column_process_by_qualified_name(column_process_qualified_name)
-        if existing_column_process:
-            logging.info(f"ColumnProcess with qualified_name '{column_process_qualified_name}' already exists. Using existing ColumnProcess.")
-            print(f"Column lineage from '{source_column.name}' to '{target_column.name}' already exists.")
-            return
+        # The process_id is deterministic, so the ColumnProcess's qualified_name can be used to find an existing one
+        process_id = "column_process_" + generate_process_id(source_column.qualified_name, target_column.qualified_name)
 
         # Create ColumnProcess entity
         column_process = ColumnProcess.creator(
-            name=column_process_name,
+            name=f"{source_column.name} -> {target_column.name}",
             connection_qualified_name=parent_process_qualified_name,  # Use parent process's qualified_name
             process_id=process_id,
             inputs=[Column.ref_by_guid(source_column.guid)],
@@ -210,154 +257,290 @@ def set_column_lineage(source_column: Column, target_column: Column, parent_proc
         )
         # Set additional attributes
         column_process.description = f"Lineage from {source_column.name} to {target_column.name}"
-        # Save the ColumnProcess entity to establish lineage
-        response = client.asset.save(column_process)
-        if response and response.assets_created(asset_type=ColumnProcess):
-            logging.info(f"Successfully created column lineage from '{source_column.name}' to '{target_column.name}'.")
-            print(f"Successfully created column lineage from '{source_column.name}' to '{target_column.name}'.")
-        else:
-            logging.error(f"Failed to create column lineage from '{source_column.name}' to '{target_column.name}'.")
-            print(f"Failed to create column lineage from '{source_column.name}' to '{target_column.name}'.")
+        return column_process
     except Exception as e:
-        logging.error(f"Error occurred while setting column lineage: {e}")
-        print(f"Error occurred while setting column lineage: {e}")
+        logging.error("Error occurred while building column lineage: %s", e)
+        print(f"Error occurred while building column lineage: {e}")
+        return None
 
-def get_columns_for_table(table: Table, connection_name: str):
+def save_process_batch(processes, asset_type):
     """
-    Retrieves all columns for a given table.
-    :param table: Table asset.
-    :param connection_name: Name of the connection the table belongs to.
-    :return: List of Column assets.
+    Saves a batch of Process or ColumnProcess entities to Atlan in a single bulk request.
+    :param processes: List of unsaved Process or ColumnProcess entities.
+    :param asset_type: Process or ColumnProcess.
+    :return: List of the created or updated assets, as returned by Atlan.
     """
     try:
-        search = (
-            FluentSearch()
-            .where(FluentSearch.active_assets())
-            .where(FluentSearch.asset_type(Column))
-            .where(Column.TABLE_QUALIFIED_NAME.eq(table.qualified_name))
-            .page_size(100)
-        ).to_request()
+        response = client.asset.save(processes)
+        if not response:
+            return []
+        created = response.assets_created(asset_type=asset_type)
+        # Atlan upserts by qualified_name, so an entity created since the existence check comes back as updated
+        updated = response.assets_updated(asset_type=asset_type)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for asset in created:
+                logging.debug("Created %s '%s' with qualified_name '%s'.", asset_type.__name__, asset.name, asset.qualified_name)
+            for asset in updated:
+                logging.debug("Updated existing %s '%s' with qualified_name '%s'.", asset_type.__name__, asset.name, asset.qualified_name)
+        return created + updated
+    except Exception as e:
+        logging.error("Error occurred while saving %s %s entities: %s", len(processes), asset_type.__name__, e)
+        print(f"Error occurred while saving {len(processes)} {asset_type.__name__} entities: {e}")
+        return []
+
+def submit_save_batches(executor, processes, asset_type):
+    """
+    Submits Process or ColumnProcess entities for saving in batches of SAVE_BATCH_SIZE entities.
+    :param executor: Executor to run the save batches on.
+    :param processes: List of unsaved Process or ColumnProcess entities.
+    :param asset_type: Process or ColumnProcess.
+    :return: List of (batch, future) tuples; each future yields the batch's created or updated assets.
+    """
+    batches = [processes[i:i + SAVE_BATCH_SIZE] for i in range(0, len(processes), SAVE_BATCH_SIZE)]
+    return [(batch, executor.submit(save_process_batch, batch, asset_type)) for batch in batches]
+
+def log_saved_count(saved_count, total_count, asset_type):
+    """Report how many of the submitted Process or ColumnProcess entities were saved."""
+    logging.info("Saved %s of %s %s entities.", saved_count, total_count, asset_type.__name__)
+    print(f"Saved {saved_count} of {total_count} {asset_type.__name__} entities.")
+
+def prefetch_columns_for_tables(table_qualified_names):
+    """
+    Retrieves all columns of a batch of tables in a single paged search, grouped by table.
+    :param table_qualified_names: Qualified names of the tables whose columns to fetch.
+    :return: Dictionary mapping table qualified_name to its columns, keyed by case-folded column name.
+    """
+    try:
+        search = COLUMN_SEARCH.where(Column.TABLE_QUALIFIED_NAME.within(table_qualified_names)).to_request()
 
         search_results = client.asset.search(search)
-        columns = [asset for asset in search_results.current_page() if isinstance(asset, Column)]
-        logging.info(f"Found {len(columns)} columns for table '{table.name}' in connection '{connection_name}'.")
-        print(f"Found {len(columns)} columns for table '{table.name}' in connection '{connection_name}':")
-        for column in columns:
-            print(f" - Column Name: {column.name}, GUID: {column.guid}, Qualified Name: {column.qualified_name}")
-        return columns
+        columns_by_table = {}
+        column_count = 0
+        for asset in search_results:
+            if isinstance(asset, Column):
+                # Map columns by name (case-insensitive) once, so every table pair can reuse it
+                columns_by_table.setdefault(asset.table_qualified_name, {})[asset.name.casefold()] = asset
+                column_count += 1
+        logging.info("Found %s columns across %s of %s tables.", column_count, len(columns_by_table), len(table_qualified_names))
+        return columns_by_table
     except Exception as e:
-        logging.error(f"Error occurred while retrieving columns for table '{table.name}': {e}")
-        return []
+        logging.error("Error occurred while retrieving columns for %s tables: %s", len(table_qualified_names), e)
+        return {}
+
+def process_table_pair(source_table: Table, target_table: Table, process: Process, columns_by_table: dict):
+    """
+    Builds column-level lineage between two tables whose table-level Process has been saved.
+    :param source_table: Source Table asset.
+    :param target_table: Target Table asset.
+    :param process: Saved Process representing the table-level lineage.
+    :param columns_by_table: Prefetched columns keyed by table qualified_name, then case-folded column name.
+    :return: List of unsaved ColumnProcess entities, including any that may already exist.
+    """
+    # Get columns for both tables
+    source_column_dict = columns_by_table.get(source_table.qualified_name, {})
+    target_column_dict = columns_by_table.get(target_table.qualified_name, {})
+
+    column_processes = []
+    matched_names = source_column_dict.keys() & target_column_dict.keys()
+    for col_name_folded in sorted(matched_names):
+        source_column, target_column = source_column_dict[col_name_folded], target_column_dict[col_name_folded]
+        logging.debug("Matched column '%s' in '%s' with column '%s' in '%s'.", source_column.name, source_table.name, target_column.name, target_table.name)
+        column_process = build_column_process(
+            source_column,
+            target_column,
+            parent_process_guid=process.guid,
+            parent_process_qualified_name=process.qualified_name,
+        )
+        if column_process:
+            column_processes.append(column_process)
+    unmatched_count = len(source_column_dict) - len(matched_names)
+    if unmatched_count:
+        logging.warning("No matching column found in '%s' for %s columns in table '%s'.", target_table.name, unmatched_count, source_table.name)
+    # One summary line per table pair instead of one per column
+    print(f"Matched {len(matched_names)} of {len(source_column_dict)} columns from '{source_table.name}' to '{target_table.name}'.")
+    return column_processes
+
+def establish_column_lineage(process_pairs, column_futures_by_table: dict):
+    """
+    Builds the column-level lineage for a group of table pairs and drops the ColumnProcesses that already exist.
+    :param process_pairs: List of (source_table, target_table, process) tuples whose Process has been saved.
+    :param column_futures_by_table: Column fetch futures keyed by table qualified_name; each yields the columns of
+        its batch of tables, as returned by prefetch_columns_for_tables.
+    :return: A tuple of the unsaved new ColumnProcess entities and the number that already exist.
+    """
+    # Only wait for the column batches that hold this group's tables
+    needed_futures = {
+        column_futures_by_table[table.qualified_name]
+        for source_table, target_table, _ in process_pairs
+        for table in (source_table, target_table)
+    }
+    columns_by_table = {}
+    for future in needed_futures:
+        columns_by_table.update(future.result())
+    built_column_processes = [
+        column_process
+        for source_table, target_table, process in process_pairs
+        for column_process in process_table_pair(source_table, target_table, process, columns_by_table)
+    ]
+    qualified_names = [column_process.qualified_name for column_process in built_column_processes]
+    existing_column_processes = {}
+    for i in range(0, len(qualified_names), EXISTENCE_CHECK_BATCH_SIZE):
+        existing_column_processes.update(
+            fetch_existing_processes(qualified_names[i:i + EXISTENCE_CHECK_BATCH_SIZE], ColumnProcess)
+        )
+    pending_column_processes = [
+        column_process for column_process in built_column_processes
+        if column_process.qualified_name not in existing_column_processes
+    ]
+    return pending_column_processes, len(existing_column_processes)
+
+def match_tables(source_table_dict: dict, target_table_dict: dict, source_label: str, target_label: str, target_connection_name: str):
+    """
+    Matches the tables of two connections by name (case-insensitive).
+    :param source_table_dict: Source Table assets keyed by case-folded name.
+    :param target_table_dict: Target Table assets keyed by case-folded name.
+    :param source_label: Display name of the source connection type, used in log messages.
+    :param target_label: Display name of the target connection type, used in log messages.
+    :param target_connection_name: Name of the connection the lineage Processes belong to.
+    :return: List of (source_table, target_table, target_connection_name) tuples.
+    """
+    table_pairs = []
+    for table_name_folded in sorted(source_table_dict.keys() & target_table_dict.keys()):
+        source_table, target_table = source_table_dict[table_name_folded], target_table_dict[table_name_folded]
+        logging.debug("Matched %s table '%s' with %s table '%s'.", source_label, source_table.name, target_label, target_table.name)
+        table_pairs.append((source_table, target_table, target_connection_name))
+    unmatched_count = len(source_table_dict.keys() - target_table_dict.keys())
+    if unmatched_count:
+        logging.warning("No matching %s table found for %s %s tables.", target_label, unmatched_count, source_label)
+    return table_pairs
 
 def main():
+    parser = argparse.ArgumentParser(description="Establish table and column lineage between Postgres, S3 and Snowflake assets in Atlan.")
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=min(8, (os.cpu_count() or 1) + 4),
+        help="Number of table pairs to process concurrently.",
+    )
+    parser.add_argument(
+        '--yes',
+        action='store_true',
+        help="Proceed without prompting for confirmation (for non-interactive runs).",
+    )
+    args = parser.parse_args()
+
+    # Keep at least one pooled connection per worker so no thread waits on a connection checkout
+    configure_http_session(pool_size=max(32, args.workers * 2))
+
     # Get connection qualified names
     postgres_connection_qualified_name = get_connection_qualified_name(config.POSTGRES_CONNECTION_NAME)
     s3_connection_qualified_name = get_connection_qualified_name(config.AWS_CONNECTION_NAME)
     snowflake_connection_qualified_name = get_connection_qualified_name(config.SNOWFLAKE_CONNECTION_NAME)
 
-    # Get tables from Postgres connection
-    postgres_tables = search_tables_in_connection(config.POSTGRES_CONNECTION_NAME)
-    proceed = confirm_proceed("Proceed with Postgres tables?")
-    if not proceed:
-        print("Aborting.")
-        return
-
-    # Get tables from S3 connection
-    s3_tables = search_tables_in_connection(config.AWS_CONNECTION_NAME)
-    proceed = confirm_proceed("Proceed with S3 tables?")
-    if not proceed:
-        print("Aborting.")
-        return
-
-    # Get tables from Snowflake connection
-    snowflake_tables = search_tables_in_connection(config.SNOWFLAKE_CONNECTION_NAME)
-    proceed = confirm_proceed("Proceed with Snowflake tables?")
-    if not proceed:
-        print("Aborting.")
-        return
-
-    # Build dictionaries to map table names to Table assets (case-insensitive)
-    postgres_table_dict = {table.name.lower(): table for table in postgres_tables}
-    s3_table_dict = {table.name.lower(): table for table in s3_tables}
-    snowflake_table_dict = {table.name.lower(): table for table in snowflake_tables}
-
-    # Establish lineage from Postgres to S3 tables
-    for table_name_lower, postgres_table in postgres_table_dict.items():
-        s3_table = s3_table_dict.get(table_name_lower)
-        if s3_table:
-            print(f"\nMatched Postgres table '{postgres_table.name}' with S3 table '{s3_table.name}'.")
-            print("Establishing table lineage...")
-            # Set table-level lineage using Process entity
-            process_guid, process_qualified_name = set_table_lineage(
-                postgres_table, s3_table, connection_qualified_name=s3_connection_qualified_name, connection_name=config.AWS_CONNECTION_NAME
-            )
+    # Search the three connections for tables concurrently, then confirm once
+    with ThreadPoolExecutor(max_workers=3) as search_executor:
+        postgres_future = search_executor.submit(search_tables_in_connection, config.POSTGRES_CONNECTION_NAME, postgres_connection_qualified_name)
+        s3_future = search_executor.submit(search_tables_in_connection, config.AWS_CONNECTION_NAME, s3_connection_qualified_name)
+        snowflake_future = search_executor.submit(search_tables_in_connection, config.SNOWFLAKE_CONNECTION_NAME, snowflake_connection_qualified_name)
+        postgres_table_dict = postgres_future.result()
+        s3_table_dict = s3_future.result()
+        snowflake_table_dict = snowflake_future.result()
+
+    # Match tables for Postgres -> S3 and S3 -> Snowflake
+    table_pairs = (
+        match_tables(postgres_table_dict, s3_table_dict, "Postgres", "S3", config.AWS_CONNECTION_NAME)
+        + match_tables(s3_table_dict, snowflake_table_dict, "S3", "Snowflake", config.SNOWFLAKE_CONNECTION_NAME)
+    )
+    print(f"\nMatched {len(table_pairs)} table pairs.")
+
+    # Column searches get their own pool, so they don't hold up building, checking and saving table lineage
+    with ThreadPoolExecutor(max_workers=args.workers) as executor, \
+            ThreadPoolExecutor(max_workers=COLUMN_FETCH_WORKERS) as column_executor:
+        # Start fetching the columns of every matched table in the background, so it overlaps with the prompt
+        matched_table_qualified_names = sorted(
+            {source_table.qualified_name for source_table, _, _ in table_pairs}
+            | {target_table.qualified_name for _, target_table, _ in table_pairs}
+        )
+        column_futures_by_table = {}
+        for i in range(0, len(matched_table_qualified_names), COLUMN_FETCH_BATCH_SIZE):
+            batch = matched_table_qualified_names[i:i + COLUMN_FETCH_BATCH_SIZE]
+            future = column_executor.submit(prefetch_columns_for_tables, batch)
+            column_futures_by_table.update((table_qualified_name, future) for table_qualified_name in batch)
+
+        proceed = confirm_proceed(
+            f"Proceed with {len(postgres_table_dict)} Postgres, {len(s3_table_dict)} S3 and {len(snowflake_table_dict)} Snowflake tables?",
+            assume_yes=args.yes,
+        )
+        if not proceed:
+            # Nothing has been written yet; drop the column fetches that have not started
+            for future in column_futures_by_table.values():
+                future.cancel()
+            print("Aborting.")
+            return
 
-            if process_guid:
-                # Get columns for both tables
-                postgres_columns = get_columns_for_table(postgres_table, config.POSTGRES_CONNECTION_NAME)
-                s3_columns = get_columns_for_table(s3_table, config.AWS_CONNECTION_NAME)
-
-                # Map columns by name (case-insensitive)
-                postgres_column_dict = {col.name.lower(): col for col in postgres_columns}
-                s3_column_dict = {col.name.lower(): col for col in s3_columns}
-
-                # Establish column-level lineage
-                for col_name_lower, postgres_column in postgres_column_dict.items():
-                    s3_column = s3_column_dict.get(col_name_lower)
-                    if s3_column:
-                        print(f" - Matched Postgres column '{postgres_column.name}' with S3 column '{s3_column.name}'.")
-                        print(f"Establishing lineage between columns '{postgres_column.name}' (Postgres) and '{s3_column.name}' (S3)...")
-                        set_column_lineage(
-                            postgres_column,
-                            s3_column,
-                            parent_process_guid=process_guid,
-                            parent_process_qualified_name=process_qualified_name,
-                        )
-                    else:
-                        logging.warning(f"No matching S3 column found for Postgres column '{postgres_column.name}' in table '{postgres_table.name}'.")
+        # Build table-level lineage for every pair (no network calls), then look up which Processes already exist in bulk
+        built_processes = [build_table_process(*pair) for pair in table_pairs]
+        existing_processes = find_existing_processes(executor, [process for process in built_processes if process], Process)
+        pending_pairs = {}
+        reused_pairs = []
+        for (source_table, target_table, _), process in zip(table_pairs, built_processes):
+            if not process:
+                print(f"Failed to create table lineage from '{source_table.name}' to '{target_table.name}'; skipping column lineage.")
+            elif process.qualified_name in existing_processes:
+                reused_pairs.append((source_table, target_table, existing_processes[process.qualified_name]))
             else:
-                print("Failed to create table lineage; skipping column lineage.")
-        else:
-            logging.warning(f"No matching S3 table found for Postgres table '{postgres_table.name}'.")
-
-    # Establish lineage from S3 to Snowflake tables
-    for table_name_lower, s3_table in s3_table_dict.items():
-        snowflake_table = snowflake_table_dict.get(table_name_lower)
-        if snowflake_table:
-            print(f"\nMatched S3 table '{s3_table.name}' with Snowflake table '{snowflake_table.name}'.")
-            print("Establishing table lineage...")
-            # Set table-level lineage using Process entity
-            process_guid, process_qualified_name = set_table_lineage(
-                s3_table, snowflake_table, connection_qualified_name=snowflake_connection_qualified_name, connection_name=config.SNOWFLAKE_CONNECTION_NAME
+                pending_pairs[process.qualified_name] = (source_table, target_table, process)
+        if existing_processes:
+            print(f"{len(existing_processes)} table lineage processes already exist.")
+
+        # Save the new table-level Processes; column lineage needs their GUIDs
+        print("\nEstablishing table lineage...")
+        pending_processes = [process for _, _, process in pending_pairs.values()]
+        table_save_futures = {
+            future: batch for batch, future in submit_save_batches(executor, pending_processes, Process)
+        }
+
+        # Column lineage for a group of pairs starts once its parent Processes have GUIDs (straight away for reused
+        # Processes, and as each save batch completes for new ones) and the column batches of its tables have been
+        # fetched, while the remaining table saves and column fetches are still running
+        column_lineage_futures = [
+            executor.submit(establish_column_lineage, reused_pairs[i:i + SAVE_BATCH_SIZE], column_futures_by_table)
+            for i in range(0, len(reused_pairs), SAVE_BATCH_SIZE)
+        ]
+        saved_process_count = 0
+        for future in as_completed(table_save_futures):
+            saved = {process.qualified_name: process for process in future.result()}
+            saved_process_count += len(saved)
+            saved_pairs = []
+            for process in table_save_futures[future]:
+                source_table, target_table, _ = pending_pairs[process.qualified_name]
+                if process.qualified_name not in saved:
+                    print(f"Failed to create table lineage from '{source_table.name}' to '{target_table.name}'; skipping column lineage.")
+                    continue
+                saved_pairs.append((source_table, target_table, saved[process.qualified_name]))
+            if saved_pairs:
+                column_lineage_futures.append(executor.submit(establish_column_lineage, saved_pairs, column_futures_by_table))
+        if pending_processes:
+            log_saved_count(saved_process_count, len(pending_processes), Process)
+
+        # Save each group's new ColumnProcesses as soon as the group has been built and checked
+        print("\nEstablishing column lineage...")
+        column_save_futures = []
+        total_column_process_count = 0
+        existing_column_process_count = 0
+        for future in as_completed(column_lineage_futures):
+            pending_column_processes, existing_count = future.result()
+            total_column_process_count += len(pending_column_processes)
+            existing_column_process_count += existing_count
+            column_save_futures.extend(
+                save_future for _, save_future in submit_save_batches(executor, pending_column_processes, ColumnProcess)
             )
+        if existing_column_process_count:
+            print(f"{existing_column_process_count} column lineage processes already exist.")
 
-            if process_guid:
-                # Get columns for both tables
-                s3_columns = get_columns_for_table(s3_table, config.AWS_CONNECTION_NAME)
-                snowflake_columns = get_columns_for_table(snowflake_table, config.SNOWFLAKE_CONNECTION_NAME)
-
-                # Map columns by name (case-insensitive)
-                s3_column_dict = {col.name.lower(): col for col in s3_columns}
-                snowflake_column_dict = {col.name.lower(): col for col in snowflake_columns}
-
-                # Establish column-level lineage
-                for col_name_lower, s3_column in s3_column_dict.items():
-                    snowflake_column = snowflake_column_dict.get(col_name_lower)
-                    if snowflake_column:
-                        print(f" - Matched S3 column '{s3_column.name}' with Snowflake column '{snowflake_column.name}'.")
-                        print(f"Establishing lineage between columns '{s3_column.name}' (S3) and '{snowflake_column.name}' (Snowflake)...")
-                        set_column_lineage(
-                            s3_column,
-                            snowflake_column,
-                            parent_process_guid=process_guid,
-                            parent_process_qualified_name=process_qualified_name,
-                        )
-                    else:
-                        logging.warning(f"No matching Snowflake column found for S3 column '{s3_column.name}' in table '{s3_table.name}'.")
-            else:
-                print("Failed to create table lineage; skipping column lineage.")
-        else:
-            logging.warning(f"No matching Snowflake table found for S3 table '{s3_table.name}'.")
+        saved_column_process_count = sum(len(future.result()) for future in column_save_futures)
+        if total_column_process_count:
+            log_saved_count(saved_column_process_count, total_column_process_count, ColumnProcess)
 
     print("\nLineage establishment completed.")
     logging.info("Lineage establishment completed.")